@@ -4,11 +4,11 @@ import logging
 from dataclasses import dataclass
 from typing import Dict, List, Sequence, Tuple
 
-from graphrag_service.config import get_settings
-from graphrag_service.embeddings import OpenAIEmbeddingClient
-from graphrag_service.llm import OpenAIChatClient
+from graphrag_service.config import get_settings, qa_relationship_union
+from graphrag_service.embeddings import get_embedding_client
+from graphrag_service.llm import get_chat_client
 from graphrag_service.neo4j_client import neo4j_session
-from graphrag_service.vector_store import FaissVectorStore, VectorHit
+from graphrag_service.vector_store import VectorHit, get_vector_store
 
 
 logger = logging.getLogger(__name__)
@@ -35,13 +35,12 @@ class RetrievalService:
 
     def answer(self, question: str, collection: str, top_k: int, max_hops: int) -> RetrievalResult:
         logger.info("Retrieval start collection=%s top_k=%d max_hops=%d", collection, top_k, max_hops)
-        store = FaissVectorStore(collection)
         try:
-            store.load()
+            store = get_vector_store(collection)
         except FileNotFoundError as exc:
             raise RuntimeError(f"Vector index for collection '{collection}' is missing.") from exc
 
-        embedding_client = OpenAIEmbeddingClient()
+        embedding_client = get_embedding_client()
         query_embedding = embedding_client.embed_texts([question])
         if query_embedding.size == 0:
             raise RuntimeError("Unable to compute embedding for the question.")
@@ -57,7 +56,7 @@ class RetrievalService:
         citations = self._build_citations(chunk_contexts, node_details)
 
         context_text = self._render_context(chunk_contexts, node_details, graph_paths)
-        chat_client = OpenAIChatClient()
+        chat_client = get_chat_client()
         system_prompt = (
             "You are a 1C domain analyst. Answer strictly in Russian using only the provided context. "
             f"If the context is insufficient, reply exactly with: \"{INSUFFICIENT_ANSWER}\"."
@@ -103,15 +102,21 @@ class RetrievalService:
         seed_ids: List[str],
         max_hops: int,
     ) -> Tuple[List[dict], Dict[str, dict], List[str]]:
-        if not seed_ids or max_hops <= 0:
+        relationship_union = qa_relationship_union()
+        # An empty allow-list can match no relationship at all, and an empty
+        # union would render the invalid pattern [r:*1..]; treat it like the
+        # no-seeds case and skip expansion.
+        if not seed_ids or max_hops <= 0 or not relationship_union:
             nodes = self._fetch_node_details(seed_ids)
             return [], nodes, []
 
-        allowed = self.settings.qa_allowed_relationships
         limit = self.settings.graph_path_limit
+        # Baking the type union into the pattern lets the planner prune
+        # disallowed relationships during expansion instead of filtering every
+        # expanded path with ALL(rel IN r ...).
         cypher = (
-            "MATCH p=(s)-[r*1..$max_hops]-(t) "
-            "WHERE elementId(s) IN $seed_ids AND ALL(rel IN r WHERE type(rel) IN $allowed) "
+            f"MATCH p=(s)-[r:{relationship_union}*1..$max_hops]-(t) "
+            "WHERE elementId(s) IN $seed_ids "
             "RETURN DISTINCT p "
             "LIMIT $limit"
         )
@@ -123,7 +128,6 @@ class RetrievalService:
                 cypher,
                 seed_ids=seed_ids,
                 max_hops=max_hops,
-                allowed=allowed,
                 limit=limit,
             )
             for record in result:
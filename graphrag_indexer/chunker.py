@@ -1,13 +1,14 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Iterable, Iterator, List
 
 from .models import Chunk, TextUnit
 from .utils import stable_guid
 
 
-def chunk_text_units(units: Iterable[TextUnit], target_tokens: int = 800, overlap_tokens: int = 120) -> List[Chunk]:
-    chunks: List[Chunk] = []
+def chunk_text_units(units: Iterable[TextUnit], target_tokens: int = 800, overlap_tokens: int = 120) -> Iterator[Chunk]:
+    """Yield chunks lazily so callers can stream units as they are produced
+    instead of materializing the whole corpus of text first."""
     target_chars = target_tokens * 4
     overlap_chars = overlap_tokens * 4
 
@@ -17,16 +18,13 @@ def chunk_text_units(units: Iterable[TextUnit], target_tokens: int = 800, overla
             locator_component = unit.locator if unit.locator is not None else ""
             seed = f"{unit.node_key.label}|{repr(unit.node_key.key)}|{locator_component}|{idx}"
             chunk_id = stable_guid(seed)
-            chunks.append(
-                Chunk(
-                    chunk_id=chunk_id,
-                    text=segment,
-                    path=unit.path,
-                    locator=unit.locator,
-                    node_key=unit.node_key,
-                )
+            yield Chunk(
+                chunk_id=chunk_id,
+                text=segment,
+                path=unit.path,
+                locator=unit.locator,
+                node_key=unit.node_key,
             )
-    return chunks
 
 
 def _chunk_text(text: str, target_chars: int, overlap_chars: int) -> List[str]:
@@ -93,6 +93,24 @@ REGISTER_WRITE_TOKENS = (
 )
 
 
+# All scan patterns are compiled once at import so the per-document hot loops
+# skip the re-cache lookup entirely.
+ROUTINE_START_RE = re.compile(
+    r"^(Процедура|Функция|Procedure|Function)\s+([A-Za-zЀ-ӿ_][\w]*)\s*\((.*?)\)\s*(.*)$",
+    flags=re.IGNORECASE,
+)
+ROUTINE_END_RE = re.compile(r"^(КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)", flags=re.IGNORECASE)
+CALL_RE = re.compile(r"([A-Za-zА-Яа-я_][\w]*)\s*\(", flags=re.UNICODE)
+REGISTER_PATTERNS = tuple(
+    (re.compile(rf"{prefix}\.([A-Za-zЀ-ӿ_][\w]*)", flags=re.UNICODE), label)
+    for prefix, label in REGISTER_PREFIXES.items()
+)
+REFERENCE_PATTERNS = tuple(
+    (re.compile(rf"{prefix}\.([A-Za-zА-Яа-я_][\w]*)", flags=re.UNICODE), label)
+    for prefix, label in REFERENCE_PREFIXES.items()
+)
+
+
 @dataclass
 class RegisterUsage:
     name: str
@@ -292,8 +310,7 @@ def _extract_role_actions(element: ET.Element) -> List[tuple[str, Optional[str]]
 
 def _extract_register_usages(body: str) -> List[RegisterUsage]:
     usages: Dict[Tuple[str, str], RegisterUsage] = {}
-    for prefix, label in REGISTER_PREFIXES.items():
-        pattern = re.compile(rf"{prefix}\.([A-Za-z\u0400-\u04FF_][\w]*)", flags=re.UNICODE)
+    for pattern, label in REGISTER_PATTERNS:
         for match in pattern.finditer(body):
             name = match.group(1)
             operations: Set[str] = set()
@@ -313,7 +330,6 @@ def _extract_register_usages(body: str) -> List[RegisterUsage]:
 
 
 def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
-    _routine_bodies.clear()
     module_node, module_key, object_node, edges, owner_qn = _build_object_and_module(document)
 
     nodes = [module_node]
@@ -323,6 +339,7 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
 
     directive_buffer: List[str] = []
     routine_map: Dict[str, NodeKey] = {}
+    routine_bodies: Dict[NodeKey, str] = {}
     current_routine_lines: List[str] = []
     current_routine_name: Optional[str] = None
     current_signature: Optional[str] = None
@@ -337,11 +354,7 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
             directive_buffer.append(stripped.lstrip("&"))
             continue
 
-        routine_match = re.match(
-            r"^(Процедура|Функция|Procedure|Function)\s+([A-Za-zЀ-ӿ_][\w]*)\s*\((.*?)\)\s*(.*)$",
-            stripped,
-            flags=re.IGNORECASE,
-        )
+        routine_match = ROUTINE_START_RE.match(stripped)
         if routine_match:
             if current_routine_name:
                 _finalize_routine(
@@ -355,6 +368,7 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
                     "\n".join(current_routine_lines),
                     document.rel_path,
                     routine_map,
+                    routine_bodies,
                 )
 
             current_routine_name = routine_match.group(2)
@@ -367,7 +381,7 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
             directive_buffer.clear()
             continue
 
-        end_match = re.match(r"^(КонецПроцедуры|КонецФункции|EndProcedure|EndFunction)", stripped, flags=re.IGNORECASE)
+        end_match = ROUTINE_END_RE.match(stripped)
         if end_match and current_routine_name:
             _finalize_routine(
                 result,
@@ -380,6 +394,7 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
                 "\n".join(current_routine_lines),
                 document.rel_path,
                 routine_map,
+                routine_bodies,
             )
             current_routine_name = None
             current_signature = None
@@ -404,14 +419,17 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
             "\n".join(current_routine_lines),
             document.rel_path,
             routine_map,
+            routine_bodies,
         )
 
     module_registers: Dict[Tuple[str, str], RegisterUsage] = {}
 
-    _seen_registers: Dict[str, NodeKey] = {}
+    # Many routines mention the same register/object; emit each node once per
+    # extraction and only append the edge for repeats.
+    emitted_nodes: Set[NodeKey] = set()
 
     for routine_name, node_key in routine_map.items():
-        body = _routine_bodies.get(node_key)
+        body = routine_bodies.get(node_key)
         if not body:
             continue
         calls = _extract_calls(body, routine_map)
@@ -432,8 +450,11 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
         for ref_name, label in references:
             reference_key = f"{label}.{ref_name}"
             ref_node = _build_object_node_from_reference(reference_key, source_path=document.rel_path)
-            result.nodes.append(ref_node)
-            result.edges.append(GraphEdge(start=node_key, type="REFERENCES", end=ref_node.node_key()))
+            ref_key = ref_node.node_key()
+            if ref_key not in emitted_nodes:
+                emitted_nodes.add(ref_key)
+                result.nodes.append(ref_node)
+            result.edges.append(GraphEdge(start=node_key, type="REFERENCES", end=ref_key))
 
     for usage in module_registers.values():
         guid = stable_guid(f"{usage.label}:{usage.name}")
@@ -443,11 +464,9 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
             properties={"name": usage.name, "guid": guid, "path": document.rel_path},
         )
         register_key = register_node.node_key()
-        if guid not in _seen_registers:
+        if register_key not in emitted_nodes:
+            emitted_nodes.add(register_key)
             result.nodes.append(register_node)
-            _seen_registers[guid] = register_key
-        else:
-            register_key = _seen_registers[guid]
         if "read" in usage.operations:
             result.edges.append(GraphEdge(start=module_key, type="READS_FROM", end=register_key))
         if "write" in usage.operations:
@@ -459,9 +478,6 @@ def _extract_bsl(document: LoadedDocument) -> ExtractionResult:
 
 
 
-_routine_bodies: Dict[NodeKey, str] = {}
-
-
 def _determine_exec_side(directives: List[str]) -> str:
     for directive in directives:
         token = directive.strip().strip("()").replace("&", "")
@@ -481,6 +497,7 @@ def _finalize_routine(
     body: str,
     source_path: str,
     routine_map: Dict[str, NodeKey],
+    routine_bodies: Dict[NodeKey, str],
 ) -> None:
     routine_guid = stable_guid(f"{module_key.label}:{module_key.key}:{name}")
     node = GraphNode(
@@ -502,13 +519,12 @@ def _finalize_routine(
     text_unit = TextUnit(text=body, path=source_path, locator=locator, node_key=node.node_key())
     result.text_units.append(text_unit)
     routine_map[name] = node.node_key()
-    _routine_bodies[node.node_key()] = body
+    routine_bodies[node.node_key()] = body
 
 
 def _extract_calls(body: str, routine_map: Dict[str, NodeKey]) -> List[str]:
-    pattern = re.compile(r"([A-Za-zА-Яа-я_][\w]*)\s*\(", flags=re.UNICODE)
     names = []
-    for match in pattern.finditer(body):
+    for match in CALL_RE.finditer(body):
         candidate = match.group(1)
         if candidate in RESERVED_CALL_NAMES:
             continue
@@ -520,8 +536,7 @@ def _extract_calls(body: str, routine_map: Dict[str, NodeKey]) -> List[str]:
 
 def _extract_references(body: str) -> List[Tuple[str, str]]:
     matches: List[Tuple[str, str]] = []
-    for prefix, label in REFERENCE_PREFIXES.items():
-        pattern = re.compile(rf"{prefix}\.([A-Za-zА-Яа-я_][\w]*)", flags=re.UNICODE)
+    for pattern, label in REFERENCE_PATTERNS:
         for match in pattern.finditer(body):
             matches.append((match.group(1), label))
     return matches
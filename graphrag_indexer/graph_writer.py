@@ -3,16 +3,16 @@ from __future__ import annotations
 import logging
 import time
 from collections import defaultdict
-from typing import Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
-
-from neo4j import Driver
-from neo4j.exceptions import Neo4jError
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Sequence, Tuple
 
 from graphrag_service.config import get_settings
 from graphrag_service.neo4j_client import get_neo4j_driver
 
 from .models import GraphEdge, GraphNode, NodeKey
 
+if TYPE_CHECKING:
+    from neo4j import Driver
+
 
 logger = logging.getLogger(__name__)
 
@@ -45,6 +45,10 @@ def _emit_log(level: str, event: str, context: Dict[str, str], **fields: object)
 class Neo4jGraphWriter:
     def __init__(self, driver: Driver | None = None) -> None:
         settings = get_settings()
+        # The writer closes drivers handed to it (preserving the original
+        # contract where close() always closed self.driver), but never the
+        # shared process-wide default, which neo4j_client closes at exit.
+        self._owns_driver = driver is not None
         self.driver = driver or get_neo4j_driver()
         self.database = settings.neo4j_database
         self.node_batch_size = settings.neo4j_node_batch_size
@@ -52,8 +56,15 @@ class Neo4jGraphWriter:
         self.max_attempts = max(1, settings.neo4j_write_max_attempts)
         self.backoff_sec = settings.neo4j_write_backoff_sec
 
+    def __enter__(self) -> "Neo4jGraphWriter":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
     def close(self) -> None:
-        self.driver.close()
+        if self._owns_driver:
+            self.driver.close()
 
     def upsert(
         self,
@@ -189,6 +200,8 @@ class Neo4jGraphWriter:
         label: str | None = None,
         rel_type: str | None = None,
     ) -> Sequence[dict] | None:
+        from neo4j.exceptions import Neo4jError
+
         attempts_allowed = self.max_attempts
         attempt = 1
         while True:
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import logging
+import os
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Iterable, List
@@ -26,15 +27,20 @@ def load_documents(root: Path) -> List[LoadedDocument]:
         logger.warning("Raw directory %s does not exist.", root)
         return documents
 
-    for path in sorted(root.rglob("*")):
-        if not path.is_file():
-            continue
-        ext = path.suffix.lower()
-        if ext not in ALLOWED_EXTENSIONS:
-            continue
-        content = _read_file(path)
-        rel_path = str(path.relative_to(root))
-        documents.append(LoadedDocument(path=path, rel_path=rel_path, extension=ext, content=content))
+    # os.walk reuses scandir entries, so we avoid the per-entry stat() that
+    # rglob("*") + is_file() pays on large trees. Sorting in place keeps the
+    # traversal deterministic.
+    for dirpath, dirnames, filenames in os.walk(root, followlinks=False):
+        dirnames.sort()
+        filenames.sort()
+        for name in filenames:
+            ext = os.path.splitext(name)[1].lower()
+            if ext not in ALLOWED_EXTENSIONS:
+                continue
+            path = Path(dirpath) / name
+            content = _read_file(path)
+            rel_path = str(path.relative_to(root))
+            documents.append(LoadedDocument(path=path, rel_path=rel_path, extension=ext, content=content))
     return documents
 
 
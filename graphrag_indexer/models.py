@@ -17,15 +17,42 @@ class NodeKey:
     def to_dict(self) -> Dict[str, str]:
         return dict(self.key)
 
+    def __hash__(self) -> int:
+        # NodeKeys are dict keys in every merge/lookup hot path; hashing the
+        # nested key tuple repeatedly is the dominant cost, so cache it.
+        cached = self.__dict__.get("_hash")
+        if cached is None:
+            cached = hash((self.label, self.key))
+            object.__setattr__(self, "_hash", cached)
+        return cached
+
+    def __getstate__(self) -> Dict[str, object]:
+        # The cached hash must not cross process boundaries: string hashes are
+        # seeded per process, so under spawn/forkserver a pickled cache would
+        # make equal keys hash differently and break dict lookups in the
+        # parent's merges. Drop it; the receiving side recomputes on first use.
+        state = dict(self.__dict__)
+        state.pop("_hash", None)
+        return state
+
+    def __setstate__(self, state: Dict[str, object]) -> None:
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+
 
 @dataclass
 class GraphNode:
     label: str
     key: Dict[str, str]
     properties: Dict[str, str | int | float | bool | None]
+    _node_key_cache: Optional[NodeKey] = field(default=None, init=False, repr=False, compare=False)
 
     def node_key(self) -> NodeKey:
-        return NodeKey.from_dict(self.label, self.key)
+        # Key fields never change after construction, so derive once; node_key()
+        # is called repeatedly in merge/write hot loops.
+        if self._node_key_cache is None:
+            self._node_key_cache = NodeKey.from_dict(self.label, self.key)
+        return self._node_key_cache
 
 
 @dataclass
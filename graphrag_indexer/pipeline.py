@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable, Dict, List, Tuple
+from typing import Callable, Dict, Iterable, Iterator, List, Tuple
 
 import numpy as np
 
 from graphrag_service.config import get_settings
-from graphrag_service.embeddings import OpenAIEmbeddingClient
+from graphrag_service.embeddings import get_embedding_client
 from graphrag_service.jobs import JobError, JobState, JobStatus, JobStore, JobStats
 from graphrag_service.queue import IndexJob
 from graphrag_service.vector_store import FaissVectorStore
@@ -16,25 +19,73 @@ from graphrag_service.vector_store import FaissVectorStore
 from .chunker import chunk_text_units
 from .extractors import extract_document
 from .graph_writer import Neo4jGraphWriter
-from .loader import load_documents
-from .models import Chunk, GraphEdge, GraphNode, NodeKey, TextUnit
+from .loader import LoadedDocument, load_documents
+from .models import Chunk, ExtractionResult, GraphEdge, GraphNode, NodeKey
 from .schema_validator import SchemaValidationError, SchemaValidator
 
 
 logger = logging.getLogger(__name__)
 
 
+_worker_validator: SchemaValidator | None = None
+
+
+def _init_extraction_worker(validator: SchemaValidator) -> None:
+    global _worker_validator
+    _worker_validator = validator
+
+
+def _extract_and_validate(doc: LoadedDocument) -> ExtractionResult:
+    if _worker_validator is None:
+        raise RuntimeError("Extraction worker used before initialization.")
+    extraction = extract_document(doc)
+    _worker_validator.validate(extraction, source=doc.rel_path)
+    return extraction
+
+
 class IndexingPipeline:
+    # Per-item saves in hot loops are throttled: persist at most every
+    # SAVE_MIN_INTERVAL_SEC or every SAVE_EVERY skipped updates.
+    SAVE_MIN_INTERVAL_SEC = 0.5
+    SAVE_EVERY = 50
+
     def __init__(self, job_store: JobStore | None = None) -> None:
         self.job_store = job_store or JobStore()
         self.settings = get_settings()
         self.schema_validator = SchemaValidator.from_config()
+        self._pending_saves = 0
+        self._last_save_monotonic = 0.0
+        # One bolt driver per run; connection setup costs ~50-200ms, so the
+        # writer is created lazily and closed when run() finishes.
+        self._graph_writer: Neo4jGraphWriter | None = None
+
+    def _get_graph_writer(self) -> Neo4jGraphWriter:
+        if self._graph_writer is None:
+            self._graph_writer = Neo4jGraphWriter()
+        return self._graph_writer
+
+    def _close_graph_writer(self) -> None:
+        if self._graph_writer is not None:
+            self._graph_writer.close()
+            self._graph_writer = None
+
+    def _save_throttled(self, job_state: JobState) -> None:
+        self._pending_saves += 1
+        now = time.monotonic()
+        if self._pending_saves < self.SAVE_EVERY and now - self._last_save_monotonic < self.SAVE_MIN_INTERVAL_SEC:
+            return
+        self.job_store.save(job_state)
+        self._pending_saves = 0
+        self._last_save_monotonic = now
 
     def run(self, job: IndexJob) -> None:
         logger.info("event=indexing_start job_id=%s collection=%s", job.job_id, job.collection)
         job_state = self.job_store.get(job.job_id) or JobState(job_id=job.job_id, collection=job.collection)
         job_state.status = JobStatus.RUNNING
-        job_state.started_at = datetime.utcnow()
+        job_state.started_at = datetime.now(timezone.utc)
+        # Wall-clock timestamps are for display; duration uses the monotonic
+        # perf_counter so NTP adjustments cannot skew it.
+        run_started = time.perf_counter()
         job_state.errors = []
         job_state.last_error_phase = None
         preserved_stats = job_state.stats if job_state.stats else JobStats()
@@ -104,16 +155,35 @@ class IndexingPipeline:
 
             nodes_by_key: Dict[NodeKey, GraphNode] = {}
             edges_keyed: Dict[Tuple[NodeKey, str, NodeKey], GraphEdge] = {}
-            text_units: List[TextUnit] = []
+            # Text units are chunked as soon as their document completes so the
+            # full routine bodies never accumulate alongside the chunks.
+            chunks: List[Chunk] = []
+            text_unit_count = 0
 
-            for doc in documents:
+            # Documents are independent until the merge step, so extraction and
+            # validation run in a process pool; merging stays serial in this
+            # thread. The in-flight window bounds memory on large corpora.
+            max_workers = max(1, min(os.cpu_count() or 1, len(documents) or 1))
+            window = max_workers * 4
+            doc_iter: Iterator[LoadedDocument] = iter(documents)
+            in_flight: Dict[Future, LoadedDocument] = {}
+
+            def submit_up_to_window(executor: ProcessPoolExecutor) -> None:
+                while len(in_flight) < window:
+                    doc = next(doc_iter, None)
+                    if doc is None:
+                        return
+                    in_flight[executor.submit(_extract_and_validate, doc)] = doc
+
+            def consume_document(doc: LoadedDocument, future: Future) -> None:
+                nonlocal text_unit_count
                 try:
-                    extraction = extract_document(doc)
-                    self.schema_validator.validate(extraction, source=doc.rel_path)
+                    extraction = future.result()
                     self._merge_nodes(nodes_by_key, extraction.nodes)
                     self._tag_edges_with_collection(extraction.edges, job.collection)
                     self._merge_edges(edges_keyed, extraction.edges)
-                    text_units.extend(extraction.text_units)
+                    text_unit_count += len(extraction.text_units)
+                    chunks.extend(chunk_text_units(extraction.text_units))
                 except SchemaValidationError as exc:
                     logger.error(
                         "event=schema_validation_failed job_id=%s collection=%s path=%s error=%s",
@@ -134,7 +204,7 @@ class IndexingPipeline:
                     job_state.errors.append(JobError(message=str(exc), path=doc.rel_path))
                 finally:
                     job_state.stats.processed_files += 1
-                    self.job_store.save(job_state)
+                    self._save_throttled(job_state)
                     if job_state.stats.processed_files % 100 == 0:
                         logger.info(
                             "event=file_progress job_id=%s collection=%s processed_files=%d total_files=%d",
@@ -144,6 +214,20 @@ class IndexingPipeline:
                             job_state.stats.total_files,
                         )
 
+            with ProcessPoolExecutor(
+                max_workers=max_workers,
+                initializer=_init_extraction_worker,
+                initargs=(self.schema_validator,),
+            ) as executor:
+                submit_up_to_window(executor)
+                while in_flight:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        consume_document(in_flight.pop(future), future)
+                    submit_up_to_window(executor)
+            # Persist the tail of the throttled per-file updates.
+            self.job_store.save(job_state)
+
             if job_state.errors:
                 logger.warning("event=job_completed_with_errors job_id=%s collection=%s errors=%d", job.job_id, job.collection, len(job_state.errors))
 
@@ -156,10 +240,9 @@ class IndexingPipeline:
                 "EXTRACTION",
                 len(nodes_by_key),
                 len(edges_keyed),
-                len(text_units),
+                text_unit_count,
             )
 
-            chunks = chunk_text_units(text_units)
             if not chunks:
                 logger.warning("event=no_chunks job_id=%s collection=%s", job.job_id, job.collection)
             else:
@@ -188,9 +271,8 @@ class IndexingPipeline:
                 )
 
             # Prepare graph write phase with totals
-            edges_list = list(edges_keyed.values())
             job_state.stats.graph_nodes_total = len(nodes_by_key)
-            job_state.stats.graph_edges_total = len(edges_list)
+            job_state.stats.graph_edges_total = len(edges_keyed)
             job_state.stats.graph_nodes_written = 0
             job_state.stats.graph_edges_written = 0
             job_state.stats.phase = "GRAPH_WRITE"
@@ -215,10 +297,12 @@ class IndexingPipeline:
                 job.job_id,
                 job.collection,
                 len(nodes_by_key),
-                len(edges_list),
+                len(edges_keyed),
             )
 
-            node_ids = self._write_graph(job_state, nodes_by_key, edges_list)
+            # Pass the dict view; the writer groups into per-label buckets
+            # itself, so no intermediate list is needed.
+            node_ids = self._write_graph(job_state, nodes_by_key, edges_keyed.values())
             # Best-effort progress: mark written equals totals upon completion
             job_state.stats.graph_nodes_written = job_state.stats.graph_nodes_total
             job_state.stats.graph_edges_written = job_state.stats.graph_edges_total
@@ -261,10 +345,8 @@ class IndexingPipeline:
             logger.info("event=phase_set job_id=%s collection=%s phase=%s", job.job_id, job.collection, "FINALIZING")
 
             job_state.status = JobStatus.DONE
-            job_state.finished_at = datetime.utcnow()
-            job_state.stats.duration_sec = (
-                (job_state.finished_at - job_state.started_at).total_seconds() if job_state.started_at else 0.0
-            )
+            job_state.finished_at = datetime.now(timezone.utc)
+            job_state.stats.duration_sec = time.perf_counter() - run_started
             self.job_store.save(job_state)
             logger.info(
                 "event=job_finished status=%s job_id=%s collection=%s duration_sec=%.3f",
@@ -276,20 +358,22 @@ class IndexingPipeline:
         except Exception as exc:  # pylint: disable=broad-except
             logger.exception("event=job_failed status=%s job_id=%s collection=%s error=%s", "ERROR", job.job_id, job.collection, exc)
             job_state.status = JobStatus.ERROR
-            job_state.finished_at = datetime.utcnow()
+            job_state.finished_at = datetime.now(timezone.utc)
             job_state.errors.append(JobError(message=str(exc)))
             job_state.last_error_phase = job_state.stats.phase or "UNKNOWN"
-            job_state.stats.duration_sec = (
-                (job_state.finished_at - job_state.started_at).total_seconds() if job_state.started_at else 0.0
-            )
+            job_state.stats.duration_sec = time.perf_counter() - run_started
             self.job_store.save(job_state)
+        finally:
+            self._close_graph_writer()
 
     def _merge_nodes(self, nodes_by_key: Dict[NodeKey, GraphNode], nodes: List[GraphNode]) -> None:
         for node in nodes:
             key = node.node_key()
             if key in nodes_by_key:
-                existing = nodes_by_key[key]
-                existing.properties.update({k: v for k, v in node.properties.items() if v is not None})
+                existing_properties = nodes_by_key[key].properties
+                for prop, value in node.properties.items():
+                    if value is not None:
+                        existing_properties[prop] = value
             else:
                 nodes_by_key[key] = node
 
@@ -303,23 +387,54 @@ class IndexingPipeline:
         if not collection:
             raise ValueError("IndexingPipeline: 'collection' is required to tag edges; got empty value")
         for edge in edges:
-            if not hasattr(edge, "properties") or edge.properties is None:
+            try:
+                properties = edge.properties
+            except AttributeError as exc:
+                raise ValueError("IndexingPipeline: GraphEdge.properties is missing; cannot set 'collection'") from exc
+            if properties is None:
                 raise ValueError("IndexingPipeline: GraphEdge.properties is missing; cannot set 'collection'")
-            if not isinstance(edge.properties, dict):
-                raise TypeError(f"IndexingPipeline: GraphEdge.properties must be a dict, got {type(edge.properties)}")
-            edge.properties["collection"] = collection
+            if not isinstance(properties, dict):
+                raise TypeError(f"IndexingPipeline: GraphEdge.properties must be a dict, got {type(properties)}")
+            properties["collection"] = collection
 
     def _compute_embeddings(self, job_state: JobState, chunks: List[Chunk]) -> np.ndarray:
         if not chunks:
             return np.zeros((0, 0), dtype=np.float32)
-        client = OpenAIEmbeddingClient()
+        client = get_embedding_client()
         texts = [chunk.text for chunk in chunks]
-        all_vectors: List[np.ndarray] = []
-        for batch_vectors in client.embed_texts_iter(texts):
-            all_vectors.append(batch_vectors)
+        # Identical chunk texts (templates, generated modules) are common in
+        # 1C dumps; embed each distinct text once and fan the vectors back out.
+        unique_texts: List[str] = []
+        positions: Dict[str, int] = {}
+        inverse = np.empty(len(texts), dtype=np.int64)
+        for index, text in enumerate(texts):
+            position = positions.get(text)
+            if position is None:
+                position = len(unique_texts)
+                positions[text] = position
+                unique_texts.append(text)
+            inverse[index] = position
+        if len(unique_texts) < len(texts):
+            logger.info(
+                "event=embedding_dedupe job_id=%s collection=%s texts=%d unique_texts=%d",
+                job_state.job_id,
+                job_state.collection,
+                len(texts),
+                len(unique_texts),
+            )
+        # Pre-allocate the full matrix once the first batch reveals the
+        # dimension; copying batches in place avoids the list + vstack double
+        # materialization that peaked at 2x the embedding memory.
+        embeddings: np.ndarray | None = None
+        offset = 0
+        for batch_vectors in client.embed_texts_iter(unique_texts):
+            if embeddings is None:
+                embeddings = np.empty((len(unique_texts), batch_vectors.shape[1]), dtype=np.float32)
             batch_count = batch_vectors.shape[0]
+            embeddings[offset : offset + batch_count] = batch_vectors
+            offset += batch_count
             job_state.stats.embedded_chunks += batch_count
-            self.job_store.save(job_state)
+            self._save_throttled(job_state)
             logger.info(
                 "event=embedding_progress job_id=%s collection=%s embedded_chunks=%d vector_chunks=%d",
                 job_state.job_id,
@@ -327,17 +442,24 @@ class IndexingPipeline:
                 job_state.stats.embedded_chunks,
                 job_state.stats.vector_chunks,
             )
-        if not all_vectors:
+        if embeddings is None:
+            self.job_store.save(job_state)
             return np.zeros((0, 0), dtype=np.float32)
-        return np.vstack(all_vectors).astype(np.float32)
+        job_state.stats.embedded_chunks = len(texts)
+        self.job_store.save(job_state)
+        if len(unique_texts) == len(texts):
+            # No duplicates: inverse is the identity, and fancy-indexing with
+            # it would copy the whole matrix for nothing.
+            return embeddings[:offset]
+        return embeddings[:offset][inverse]
 
     def _write_graph(
         self,
         job_state: JobState,
         nodes_by_key: Dict[NodeKey, GraphNode],
-        edges: List[GraphEdge],
+        edges: Iterable[GraphEdge],
     ) -> Dict[NodeKey, str]:
-        writer = Neo4jGraphWriter()
+        writer = self._get_graph_writer()
         context = {"job_id": job_state.job_id, "collection": job_state.collection}
         try:
             logger.info(
@@ -385,7 +507,8 @@ class IndexingPipeline:
             )
             return node_ids
         finally:
-            writer.close()
+            # The session closes inside upsert; the shared driver stays open
+            # until run() finishes.
             logger.info(
                 "event=neo4j_session_closed job_id=%s collection=%s database=%s",
                 job_state.job_id,
@@ -406,8 +529,13 @@ class IndexingPipeline:
         store = FaissVectorStore(collection)
         store.build(embeddings, [chunk.chunk_id for chunk in chunks])
         metadata = []
-        for chunk in chunks:
-            node_id = node_ids.get(chunk.node_key)
+        missing_node_ids = 0
+        # Resolve node ids in one pass up front so the metadata loop below
+        # does no NodeKey hashing.
+        chunk_node_ids = [node_ids.get(chunk.node_key) for chunk in chunks]
+        for chunk, node_id in zip(chunks, chunk_node_ids):
+            if node_id is None:
+                missing_node_ids += 1
             metadata.append(
                 {
                     "chunk_id": chunk.chunk_id,
@@ -418,14 +546,22 @@ class IndexingPipeline:
                     "text_snippet": chunk.text[:300],
                 }
             )
-            logger.info(
-                "event=chunk_metadata job_id=%s collection=%s chunk_id=%s node_id=%s path=%s locator=%s",
-                job_id,
-                collection,
-                chunk.chunk_id,
-                node_id,
-                chunk.path,
-                chunk.locator,
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "event=chunk_metadata job_id=%s collection=%s chunk_id=%s node_id=%s path=%s locator=%s",
+                    job_id,
+                    collection,
+                    chunk.chunk_id,
+                    node_id,
+                    chunk.path,
+                    chunk.locator,
+                )
+        logger.info(
+            "event=chunk_metadata_summary job_id=%s collection=%s chunks=%d missing_node_id=%d",
+            job_id,
+            collection,
+            len(chunks),
+            missing_node_ids,
+        )
         store.set_metadata(metadata)
         store.save()
@@ -3,15 +3,22 @@
 import json
 import logging
 import os
+from collections import defaultdict
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Optional, Set
+from typing import Dict, FrozenSet, List, Optional, Sequence
 
 try:
     import yaml  # type: ignore
 except ImportError:  # pragma: no cover
     yaml = None
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from .models import ExtractionResult, GraphEdge, GraphNode, TextUnit
 
 
@@ -25,8 +32,8 @@ class SchemaValidationError(ValueError):
 @dataclass(frozen=True)
 class NodeSpec:
     label: str
-    required: Set[str]
-    allowed: Set[str]
+    required: FrozenSet[str]
+    allowed: FrozenSet[str]
 
 
 class SchemaValidator:
@@ -42,7 +49,13 @@ class SchemaValidator:
 
     @classmethod
     def from_config(cls) -> "SchemaValidator":
-        config_env = os.getenv("GRAPH_SCHEMA_CONFIG")
+        # Memoized per env-var combination so repeated pipeline/worker
+        # construction does not re-read and re-parse the schema files.
+        return cls._from_config_cached(os.getenv("GRAPH_SCHEMA_CONFIG"), os.getenv("GRAPH_SCHEMA_PATH"))
+
+    @classmethod
+    @lru_cache(maxsize=4)
+    def _from_config_cached(cls, config_env: Optional[str], schema_env: Optional[str]) -> "SchemaValidator":
         config_path = Path(config_env) if config_env else cls.DEFAULT_CONFIG_PATH
         schema_path: Optional[Path] = None
 
@@ -52,7 +65,6 @@ class SchemaValidator:
             logger.info("Schema config %s not found; falling back to JSON schema only.", config_path)
 
         if schema_path is None:
-            schema_env = os.getenv("GRAPH_SCHEMA_PATH")
             schema_path = Path(schema_env) if schema_env else cls.DEFAULT_SCHEMA_PATH
 
         if not schema_path.exists():
@@ -85,57 +97,81 @@ class SchemaValidator:
         return (config_path.parent / Path(file_value)).resolve()
 
     def _load_schema(self, schema_path: Path) -> None:
-        with schema_path.open(encoding="utf-8") as handle:
-            data = json.load(handle)
+        raw = schema_path.read_bytes()
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
 
         self._node_specs: Dict[str, NodeSpec] = {}
         for node in data["node_types"]:
             label = node["label"]
             properties = node.get("properties", [])
-            allowed = {prop["name"] for prop in properties}
-            required = {prop["name"] for prop in properties if prop.get("required")}
+            allowed = frozenset(prop["name"] for prop in properties)
+            required = frozenset(prop["name"] for prop in properties if prop.get("required"))
             self._node_specs[label] = NodeSpec(label=label, required=required, allowed=allowed)
 
-        self._allowed_relationships: Set[str] = set(data.get("relationship_types", []))
+        self._allowed_relationships: FrozenSet[str] = frozenset(data.get("relationship_types", []))
         self._additional_node_types = data.get("additional_node_types", True)
         self._additional_relationship_types = data.get("additional_relationship_types", True)
         self._additional_properties_allowed = data.get("additional_properties_allowed", True)
+        # With a fully permissive schema per-node validation can never fail, so
+        # the hot loops skip straight out.
+        self._node_fast_path = (
+            self._additional_node_types
+            and self._additional_properties_allowed
+            and not any(spec.required for spec in self._node_specs.values())
+        )
+        self._edge_fast_path = self._additional_relationship_types
 
     def validate(self, extraction: ExtractionResult, *, source: str | None = None) -> None:
-        for node in extraction.nodes:
-            self._validate_node(node, source)
-        for edge in extraction.edges:
-            self._validate_edge(edge, source)
+        self.validate_batch(extraction.nodes, extraction.edges, source=source)
         for text_unit in extraction.text_units:
             self._validate_text_unit(text_unit, source)
 
-    def _validate_node(self, node: GraphNode, source: Optional[str]) -> None:
-        spec = self._node_specs.get(node.label)
-        if spec is None:
-            if self._additional_node_types:
-                return
-            raise SchemaValidationError(self._message(f"Unknown node label '{node.label}'", source))
-
-        if not self._additional_properties_allowed:
-            unknown_props = set(node.properties.keys()) - spec.allowed
-            if unknown_props:
-                self._fail(
-                    message=f"Node '{node.label}' contains unsupported properties: {sorted(unknown_props)}",
-                    source=source,
-                    label=node.label,
-                    unknown_properties=sorted(unknown_props),
-                )
-
-        missing_required = [prop for prop in spec.required if node.properties.get(prop) in (None, "")]
-        if missing_required:
-            self._fail(
-                message=f"Node '{node.label}' missing required properties: {missing_required}",
-                source=source,
-                label=node.label,
-                missing_properties=missing_required,
-            )
+    def validate_batch(
+        self,
+        nodes: Sequence[GraphNode],
+        edges: Sequence[GraphEdge],
+        *,
+        source: str | None = None,
+    ) -> None:
+        """Validate nodes grouped by label so the spec lookup and its sets are
+        resolved once per label instead of once per node."""
+        if not self._node_fast_path:
+            nodes_by_label: Dict[str, List[GraphNode]] = defaultdict(list)
+            for node in nodes:
+                nodes_by_label[node.label].append(node)
+            for label, bucket in nodes_by_label.items():
+                spec = self._node_specs.get(label)
+                if spec is None:
+                    if self._additional_node_types:
+                        continue
+                    raise SchemaValidationError(self._message(f"Unknown node label '{label}'", source))
+                allowed = spec.allowed
+                required = spec.required
+                check_properties = not self._additional_properties_allowed
+                for node in bucket:
+                    if check_properties:
+                        unknown_props = set(node.properties.keys()) - allowed
+                        if unknown_props:
+                            self._fail(
+                                message=f"Node '{label}' contains unsupported properties: {sorted(unknown_props)}",
+                                source=source,
+                                label=label,
+                                unknown_properties=sorted(unknown_props),
+                            )
+                    missing_required = [prop for prop in required if node.properties.get(prop) in (None, "")]
+                    if missing_required:
+                        self._fail(
+                            message=f"Node '{label}' missing required properties: {missing_required}",
+                            source=source,
+                            label=label,
+                            missing_properties=missing_required,
+                        )
+        for edge in edges:
+            self._validate_edge(edge, source)
 
     def _validate_edge(self, edge: GraphEdge, source: Optional[str]) -> None:
+        if self._edge_fast_path and edge.start and edge.end:
+            return
         if edge.type not in self._allowed_relationships:
             if self._additional_relationship_types:
                 return
@@ -153,7 +189,7 @@ class SchemaValidator:
             )
 
     def _validate_text_unit(self, text_unit: TextUnit, source: Optional[str]) -> None:
-        if not text_unit.path or not text_unit.path.strip():
+        if not text_unit.path or text_unit.path.isspace():
             self._fail(
                 message="TextUnit missing required file path",
                 source=source,
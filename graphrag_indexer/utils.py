@@ -1,10 +1,16 @@
 from __future__ import annotations
 
+from functools import lru_cache
 from uuid import UUID, uuid5
 
 NAMESPACE_UUID = UUID("9d2f4c0a-59ac-4b75-9b8d-7e2d8d2cb3a5")
 
 
+@lru_cache(maxsize=1 << 20)
 def stable_guid(value: str) -> str:
-    """Generate a deterministic GUID based on a string value."""
+    """Generate a deterministic GUID based on a string value.
+
+    The same keys recur across documents during extraction, so results are
+    memoized; the cache is bounded for long-running indexer processes.
+    """
     return str(uuid5(NAMESPACE_UUID, value))
@@ -3,13 +3,9 @@ from __future__ import annotations
 import logging
 import signal
 import sys
-import time
-from pathlib import Path
 from typing import Optional
 
-from graphrag_service.config import get_settings
-from graphrag_service.jobs import JobStatus
-from graphrag_service.queue import JobQueue, IndexJob
+from graphrag_service.queue import JobQueue
 
 from .pipeline import IndexingPipeline
 
@@ -30,49 +26,28 @@ class Worker:
     def run(self) -> None:
         logger.info("event=worker_started service=indexer")
         while not self._stopped:
+            # BLPOP already blocks in the kernel for the timeout; loop straight
+            # back so job pickup latency is bounded by the timeout alone.
             job = self.queue.dequeue(timeout=5)
             if not job:
-                time.sleep(1)
                 continue
             logger.info("event=job_dequeued job_id=%s collection=%s", job.job_id, job.collection)
             try:
                 self.pipeline.run(job)
             except Exception as exc:  # pylint: disable=broad-except
                 logger.exception("event=job_unexpected_error job_id=%s collection=%s error=%s", job.job_id, job.collection, exc)
+            finally:
+                self.queue.ack(job)
 
         logger.info("event=worker_stopped service=indexer")
 
     def _recover_incomplete_jobs(self) -> None:
-        settings = get_settings()
-        queue_job_ids = self.queue.list_job_ids()
-        workspace_dir = Path(settings.workspace_dir)
-        for state in self.pipeline.job_store.iter_states():
-            if state.status not in {JobStatus.PENDING, JobStatus.RUNNING}:
-                continue
-            if state.job_id in queue_job_ids:
-                continue
-            raw_path = workspace_dir / state.collection / state.job_id / "raw"
-            if not raw_path.is_dir():
-                logger.error(
-                    "event=job_recover_missing_raw job_id=%s collection=%s path=%s status=%s",
-                    state.job_id,
-                    state.collection,
-                    raw_path,
-                    state.status.value,
-                )
-                continue
-            logger.warning(
-                "event=job_recover_requeue job_id=%s collection=%s status=%s",
-                state.job_id,
-                state.collection,
-                state.status.value,
-            )
-            state.status = JobStatus.PENDING
-            state.started_at = None
-            state.finished_at = None
-            self.pipeline.job_store.save(state)
-            self.queue.enqueue(IndexJob(job_id=state.job_id, collection=state.collection, raw_path=str(raw_path)))
-            queue_job_ids.add(state.job_id)
+        # Unacked jobs stay in this host's processing list, so recovery is an
+        # atomic requeue of that list instead of a scan over every job state
+        # ever stored in Redis.
+        requeued = self.queue.recover_own()
+        if requeued:
+            logger.warning("event=job_recover_requeue service=indexer requeued=%d", requeued)
 
 
 def main() -> None:
@@ -1,56 +1,175 @@
 from __future__ import annotations
 
+import hashlib
+import random
 import time
-from typing import Iterable, List, Sequence
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, Deque, Iterable, List, Sequence
 
 import numpy as np
-from openai import OpenAI, OpenAIError
 
 from .config import get_settings
 
+if TYPE_CHECKING:
+    from openai import OpenAIError
+
 
 class OpenAIEmbeddingClient:
     """Wrapper around OpenAI embedding API with batching and retries."""
 
     def __init__(self) -> None:
+        # Deferred so workers can start consuming the queue before the
+        # openai/httpx import cost is paid.
+        from openai import OpenAI
+
         settings = get_settings()
         if not settings.openai_api_key:
             raise RuntimeError("OPENAI_API_KEY is not configured.")
         self.client = OpenAI(api_key=settings.openai_api_key)
         self.model = settings.embedding_model
         self.batch_size = settings.max_embedding_batch
+        self.concurrency = settings.embedding_concurrency
         self.max_attempts = settings.embedding_retry_attempts
         self.backoff = settings.embedding_retry_backoff
+        # Bounded LRU of text-digest -> vector; re-indexing runs hit many
+        # verbatim-identical chunks, which never need a second API call.
+        self._cache: OrderedDict[bytes, np.ndarray] = OrderedDict()
+        self._cache_maxsize = self.batch_size * 512
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        return hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+    def _cache_get(self, digest: bytes) -> np.ndarray | None:
+        vector = self._cache.get(digest)
+        if vector is not None:
+            self._cache.move_to_end(digest)
+        return vector
+
+    def _cache_put(self, digest: bytes, vector: np.ndarray) -> None:
+        self._cache[digest] = vector
+        self._cache.move_to_end(digest)
+        while len(self._cache) > self._cache_maxsize:
+            self._cache.popitem(last=False)
 
     def embed_texts(self, texts: Sequence[str]) -> np.ndarray:
-        embeddings: List[np.ndarray] = []
+        if not texts:
+            return np.zeros((0, 0), dtype=np.float32)
+        if len(texts) > self._cache_maxsize:
+            # The batch alone would churn the whole cache; skip it.
+            return self._embed_texts_uncached(texts)
+
+        digests = [self._digest(text) for text in texts]
+        miss_texts: List[str] = []
+        miss_digests: List[bytes] = []
+        seen: set[bytes] = set()
+        for text, digest in zip(texts, digests):
+            if digest in seen or self._cache_get(digest) is not None:
+                continue
+            seen.add(digest)
+            miss_texts.append(text)
+            miss_digests.append(digest)
+
+        if miss_texts:
+            row = 0
+            for batch_vectors in self.embed_texts_iter(miss_texts):
+                for vector in batch_vectors:
+                    # Copy so the cache does not pin the whole batch buffer.
+                    self._cache_put(miss_digests[row], np.array(vector, dtype=np.float32))
+                    row += 1
+
+        dim = self._cache[digests[0]].shape[0]
+        out = np.empty((len(texts), dim), dtype=np.float32)
+        for idx, digest in enumerate(digests):
+            out[idx] = self._cache[digest]
+        return out
+
+    def _embed_texts_uncached(self, texts: Sequence[str]) -> np.ndarray:
+        out: np.ndarray | None = None
+        offset = 0
         for batch_vectors in self.embed_texts_iter(texts):
-            embeddings.append(batch_vectors)
-        if not embeddings:
+            if out is None:
+                # Dimension is known after the first batch; preallocate the
+                # full result and fill slices instead of vstacking at the end.
+                out = np.empty((len(texts), batch_vectors.shape[1]), dtype=np.float32)
+            out[offset : offset + len(batch_vectors)] = batch_vectors
+            offset += len(batch_vectors)
+        if out is None:
             return np.zeros((0, 0), dtype=np.float32)
-        return np.vstack(embeddings).astype(np.float32)
+        return out if offset == len(out) else out[:offset]
 
     def embed_texts_iter(self, texts: Sequence[str]) -> Iterable[np.ndarray]:
-        """Yield embeddings per batch as ndarrays with shape (batch_size, dim)."""
+        """Yield embeddings per batch, in input order, as ndarrays with shape
+        (batch_size, dim). Batches are requested concurrently since the API
+        calls are network-bound."""
         if not texts:
             return
-        for batch_start in range(0, len(texts), self.batch_size):
-            batch = list(texts[batch_start : batch_start + self.batch_size])
-            vectors = self._embed_batch(batch)
-            if vectors:
-                yield np.vstack(vectors).astype(np.float32)
+        batches = [list(texts[start : start + self.batch_size]) for start in range(0, len(texts), self.batch_size)]
+        workers = min(self.concurrency, len(batches))
+        if workers <= 1:
+            for batch in batches:
+                vectors = self._embed_batch(batch)
+                if len(vectors):
+                    yield vectors
+            return
+
+        batch_iter = iter(batches)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            # Sliding window of in-flight requests: results come back in
+            # submission order, and each consumed batch refills the window.
+            pending: Deque[Future[np.ndarray]] = deque()
+            for _ in range(workers):
+                batch = next(batch_iter, None)
+                if batch is None:
+                    break
+                pending.append(executor.submit(self._embed_batch, batch))
+            while pending:
+                vectors = pending.popleft().result()
+                batch = next(batch_iter, None)
+                if batch is not None:
+                    pending.append(executor.submit(self._embed_batch, batch))
+                if len(vectors):
+                    yield vectors
+
+    def _embed_batch(self, batch: Sequence[str]) -> np.ndarray:
+        from openai import OpenAIError
 
-    def _embed_batch(self, batch: Sequence[str]) -> List[np.ndarray]:
         attempt = 0
         while True:
             attempt += 1
             try:
                 response = self.client.embeddings.create(model=self.model, input=batch)
-                vectors = [np.array(item.embedding, dtype=np.float32) for item in response.data]
-                return vectors
+                # One bulk conversion instead of a per-row np.array + vstack.
+                return np.asarray([item.embedding for item in response.data], dtype=np.float32)
             except OpenAIError as exc:
                 if attempt >= self.max_attempts:
                     raise
-                sleep_for = self.backoff * attempt
-                time.sleep(sleep_for)
+                time.sleep(self._retry_delay(exc, attempt))
+
+    def _retry_delay(self, exc: OpenAIError, attempt: int) -> float:
+        # Respect the server's Retry-After hint when present; otherwise use
+        # exponential backoff with jitter so concurrent workers hitting the
+        # same rate limit do not retry in lockstep.
+        response = getattr(exc, "response", None)
+        if response is not None:
+            retry_after = response.headers.get("Retry-After")
+            if retry_after:
+                try:
+                    return min(60.0, float(retry_after))
+                except ValueError:
+                    pass
+        return min(60.0, random.uniform(self.backoff, self.backoff * 2**attempt))
+
+
+@lru_cache(maxsize=1)
+def get_embedding_client() -> OpenAIEmbeddingClient:
+    """Return the process-wide embedding client.
+
+    Mirrors get_redis_client/get_neo4j_driver: one shared instance per
+    process. Sharing it is also what makes the embedding LRU effective --
+    a per-call client starts with an empty cache every time.
+    """
+    return OpenAIEmbeddingClient()
 
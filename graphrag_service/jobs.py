@@ -1,16 +1,38 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass, field
-from datetime import datetime
+from dataclasses import dataclass, field, fields
+from datetime import datetime, timezone
 from enum import Enum
 from typing import Any, Dict, Iterator, List, Optional
 
 from redis import Redis
+from redis.exceptions import ResponseError
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
 
 from .config import get_settings
 
 
+def _json_dumps(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
 class JobStatus(str, Enum):
     PENDING = "PENDING"
     RUNNING = "RUNNING"
@@ -50,25 +72,29 @@ class JobState:
     status: JobStatus = JobStatus.PENDING
     stats: JobStats = field(default_factory=JobStats)
     errors: List[JobError] = field(default_factory=list)
-    created_at: datetime = field(default_factory=datetime.utcnow)
-    updated_at: datetime = field(default_factory=datetime.utcnow)
+    created_at: datetime = field(default_factory=_utcnow)
+    updated_at: datetime = field(default_factory=_utcnow)
     started_at: Optional[datetime] = None
     finished_at: Optional[datetime] = None
     retry_count: int = 0
     last_error_phase: Optional[str] = None
 
     def to_primitive(self) -> Dict[str, Any]:
-        payload = asdict(self)
-        payload["status"] = self.status.value
-        payload["created_at"] = self.created_at.isoformat()
-        payload["updated_at"] = self.updated_at.isoformat()
-        payload["started_at"] = self.started_at.isoformat() if self.started_at else None
-        payload["finished_at"] = self.finished_at.isoformat() if self.finished_at else None
-        payload["errors"] = [asdict(err) for err in self.errors]
-        payload["stats"] = asdict(self.stats)
-        payload["retry_count"] = self.retry_count
-        payload["last_error_phase"] = self.last_error_phase
-        return payload
+        # Built by hand instead of asdict(), which deep-copies the whole state
+        # tree (stats plus the errors list) on every call.
+        return {
+            "job_id": self.job_id,
+            "collection": self.collection,
+            "status": self.status.value,
+            "stats": dict(self.stats.__dict__),
+            "errors": [dict(err.__dict__) for err in self.errors],
+            "created_at": self.created_at.isoformat(),
+            "updated_at": self.updated_at.isoformat(),
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+            "retry_count": self.retry_count,
+            "last_error_phase": self.last_error_phase,
+        }
 
     @staticmethod
     def from_primitive(payload: Dict[str, Any]) -> "JobState":
@@ -84,8 +110,8 @@ class JobState:
             status=status,
             stats=stats,
             errors=errors,
-            created_at=parse_dt(payload.get("created_at")) or datetime.utcnow(),
-            updated_at=parse_dt(payload.get("updated_at")) or datetime.utcnow(),
+            created_at=parse_dt(payload.get("created_at")) or _utcnow(),
+            updated_at=parse_dt(payload.get("updated_at")) or _utcnow(),
             started_at=parse_dt(payload.get("started_at")),
             finished_at=parse_dt(payload.get("finished_at")),
             retry_count=payload.get("retry_count", 0),
@@ -93,26 +119,124 @@ class JobState:
         )
 
 
+def _state_to_hash(state: JobState) -> Dict[str, str]:
+    mapping: Dict[str, str] = {
+        "job_id": state.job_id,
+        "collection": state.collection,
+        "status": state.status.value,
+        "created_at": state.created_at.isoformat(),
+        "updated_at": state.updated_at.isoformat(),
+        "started_at": state.started_at.isoformat() if state.started_at else "",
+        "finished_at": state.finished_at.isoformat() if state.finished_at else "",
+        "retry_count": str(state.retry_count),
+        "last_error_phase": state.last_error_phase or "",
+        "errors": _json_dumps([err.__dict__ for err in state.errors]).decode("utf-8"),
+    }
+    for stats_field in fields(JobStats):
+        value = getattr(state.stats, stats_field.name)
+        if stats_field.name == "session_segments":
+            mapping["stats_session_segments"] = _json_dumps(value).decode("utf-8")
+        else:
+            mapping[f"stats_{stats_field.name}"] = str(value)
+    return mapping
+
+
+def _decode(value: Any) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else str(value)
+
+
+def _state_from_hash(raw: Dict[Any, Any]) -> JobState:
+    data = {_decode(key): _decode(value) for key, value in raw.items()}
+
+    stats_kwargs: Dict[str, Any] = {}
+    for stats_field in fields(JobStats):
+        value = data.get(f"stats_{stats_field.name}")
+        if value is None:
+            continue
+        if stats_field.name == "phase":
+            stats_kwargs["phase"] = value
+        elif stats_field.name == "session_segments":
+            stats_kwargs["session_segments"] = _json_loads(value)
+        elif stats_field.name == "duration_sec":
+            stats_kwargs["duration_sec"] = float(value)
+        else:
+            stats_kwargs[stats_field.name] = int(float(value))
+
+    parse_dt = lambda value: datetime.fromisoformat(value) if value else None
+
+    return JobState(
+        job_id=data["job_id"],
+        collection=data["collection"],
+        status=JobStatus(data["status"]),
+        stats=JobStats(**stats_kwargs),
+        errors=[JobError(**err) for err in _json_loads(data.get("errors", "[]"))],
+        created_at=parse_dt(data.get("created_at")) or _utcnow(),
+        updated_at=parse_dt(data.get("updated_at")) or _utcnow(),
+        started_at=parse_dt(data.get("started_at")),
+        finished_at=parse_dt(data.get("finished_at")),
+        retry_count=int(data.get("retry_count", 0)),
+        last_error_phase=data.get("last_error_phase") or None,
+    )
+
+
 class JobStore:
-    """Store and retrieve job states in Redis."""
+    """Store and retrieve job states in Redis.
+
+    States live in hashes so hot counters can be bumped with HINCRBY instead
+    of a full JSON read-modify-write; all multi-command writes are pipelined
+    into one round-trip.
+    """
 
     def __init__(self, redis_client: Optional[Redis] = None) -> None:
         self.redis = redis_client or get_settings_redis()
         self.prefix = get_settings().job_state_prefix
+        # Pre-encoded template keeps per-update key construction to a single
+        # bytes concat instead of an f-string format (redis-py takes bytes keys).
+        self._key_prefix = f"{self.prefix}:".encode()
 
-    def _key(self, job_id: str) -> str:
-        return f"{self.prefix}:{job_id}"
+    def _key(self, job_id: str) -> bytes:
+        return self._key_prefix + job_id.encode()
 
     def save(self, state: JobState) -> None:
-        state.updated_at = datetime.utcnow()
-        self.redis.set(self._key(state.job_id), json.dumps(state.to_primitive()))
+        state.updated_at = _utcnow()
+        key = self._key(state.job_id)
+        # MULTI/EXEC so a concurrent status read never lands between the
+        # delete and the rewrite and sees the job as missing; still one
+        # round-trip. DELETE first so stale fields (and legacy JSON-string
+        # values) do not survive the rewrite.
+        pipe = self.redis.pipeline(transaction=True)
+        pipe.delete(key)
+        pipe.hset(key, mapping=_state_to_hash(state))
+        pipe.execute()
 
     def get(self, job_id: str) -> Optional[JobState]:
-        raw = self.redis.get(self._key(job_id))
-        if not raw:
+        return self._get_by_key(self._key(job_id))
+
+    def _get_by_key(self, key: bytes | str) -> Optional[JobState]:
+        try:
+            raw = self.redis.hgetall(key)
+        except ResponseError:
+            raw = None
+        if raw:
+            return _state_from_hash(raw)
+        # Fall back to states written as JSON blobs by older versions.
+        try:
+            legacy = self.redis.get(key)
+        except ResponseError:
+            return None
+        if not legacy:
             return None
-        data = json.loads(raw)
-        return JobState.from_primitive(data)
+        return JobState.from_primitive(_json_loads(legacy))
+
+    def bump_stats(self, job_id: str, **deltas: int) -> None:
+        """Increment integer stats counters in one pipelined round-trip without
+        rewriting the rest of the state."""
+        key = self._key(job_id)
+        pipe = self.redis.pipeline(transaction=False)
+        for name, delta in deltas.items():
+            pipe.hincrby(key, f"stats_{name}", delta)
+        pipe.hset(key, "updated_at", _utcnow().isoformat())
+        pipe.execute()
 
     def update(self, job_id: str, **updates: Any) -> JobState:
         state = self.get(job_id)
@@ -129,14 +253,33 @@ class JobStore:
         self.save(state)
         return state
 
+    SCAN_BATCH = 100
+
     def iter_states(self) -> Iterator[JobState]:
         pattern = f"{self.prefix}:*"
-        for key in self.redis.scan_iter(match=pattern):
-            raw = self.redis.get(key)
-            if not raw:
-                continue
-            data = json.loads(raw)
-            yield JobState.from_primitive(data)
+        batch: List[Any] = []
+        for key in self.redis.scan_iter(match=pattern, count=self.SCAN_BATCH):
+            batch.append(key)
+            if len(batch) >= self.SCAN_BATCH:
+                yield from self._load_batch(batch)
+                batch = []
+        if batch:
+            yield from self._load_batch(batch)
+
+    def _load_batch(self, keys: List[Any]) -> Iterator[JobState]:
+        # One pipelined HGETALL round-trip per batch; legacy JSON-string keys
+        # surface as errors and are retried individually through the fallback.
+        pipe = self.redis.pipeline(transaction=False)
+        for key in keys:
+            pipe.hgetall(key)
+        results = pipe.execute(raise_on_error=False)
+        for key, raw in zip(keys, results):
+            if isinstance(raw, Exception) or not raw:
+                state = self._get_by_key(key)
+            else:
+                state = _state_from_hash(raw)
+            if state is not None:
+                yield state
 
 
 def get_settings_redis() -> Redis:
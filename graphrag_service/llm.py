@@ -1,33 +1,75 @@
 from __future__ import annotations
 
-from typing import List
-
-from openai import OpenAI, OpenAIError
+from functools import lru_cache
+from typing import TYPE_CHECKING, Iterator, List
 
 from .config import get_settings
 
+if TYPE_CHECKING:
+    import httpx
+
+
+def _make_http_client() -> "httpx.Client | None":
+    import httpx
+
+    # HTTP/2 multiplexes concurrent QA requests over one TLS connection; it
+    # needs the optional h2 package, so fall back to the default client.
+    try:
+        return httpx.Client(http2=True, limits=httpx.Limits(max_connections=32))
+    except ImportError:  # pragma: no cover
+        return None
+
 
 class OpenAIChatClient:
     """Wrapper for OpenAI chat completions used in Q&A pipeline."""
 
     def __init__(self) -> None:
+        from openai import OpenAI
+
         settings = get_settings()
         if not settings.openai_api_key:
             raise RuntimeError("OPENAI_API_KEY is not configured.")
-        self.client = OpenAI(api_key=settings.openai_api_key)
+        http_client = _make_http_client()
+        if http_client is not None:
+            self.client = OpenAI(api_key=settings.openai_api_key, http_client=http_client)
+        else:
+            self.client = OpenAI(api_key=settings.openai_api_key)
         self.model = settings.qa_model
         self.temperature = settings.qa_temperature
         self.max_tokens = settings.qa_max_tokens
 
-    def complete(self, system_prompt: str, messages: List[dict]) -> str:
+    def complete_stream(self, system_prompt: str, messages: List[dict]) -> Iterator[str]:
+        """Yield response text chunks as they arrive from the API."""
+        from openai import OpenAIError
+
         try:
-            response = self.client.chat.completions.create(
+            stream = self.client.chat.completions.create(
                 model=self.model,
                 temperature=self.temperature,
                 max_tokens=self.max_tokens,
                 messages=[{"role": "system", "content": system_prompt}, *messages],
+                stream=True,
             )
+            for chunk in stream:
+                if not chunk.choices:
+                    continue
+                content = chunk.choices[0].delta.content
+                if content:
+                    yield content
         except OpenAIError as exc:  # pragma: no cover
             raise RuntimeError(f"Failed to generate response: {exc}") from exc
 
-        return response.choices[0].message.content or ""
+    def complete(self, system_prompt: str, messages: List[dict]) -> str:
+        return "".join(self.complete_stream(system_prompt, messages))
+
+
+@lru_cache(maxsize=1)
+def get_chat_client() -> OpenAIChatClient:
+    """Return the process-wide chat client.
+
+    Same singleton shape as get_embedding_client/get_redis_client. A per-call
+    client would build (and leak) a fresh httpx.Client per request; the shared
+    one keeps its connection pool, so concurrent QA requests actually reuse --
+    and with h2 installed, multiplex over -- established TLS connections.
+    """
+    return OpenAIChatClient()
@@ -1,24 +1,42 @@
 from __future__ import annotations
 
+import atexit
 from contextlib import contextmanager
+from functools import lru_cache
 from typing import Iterator
 
-from neo4j import GraphDatabase
-
 from .config import get_settings
 
 
+@lru_cache(maxsize=1)
 def get_neo4j_driver():
+    """Return the process-wide Neo4j driver.
+
+    The driver wraps a bolt connection pool, so it is created once and shared;
+    opening one per session would pay the TCP/TLS/bolt handshake every time.
+    The neo4j import is deferred so processes that never touch the graph do
+    not pay it at startup.
+    """
+    from neo4j import GraphDatabase
+
     settings = get_settings()
-    return GraphDatabase.driver(settings.neo4j_uri, auth=(settings.neo4j_username, settings.neo4j_password))
+    return GraphDatabase.driver(
+        settings.neo4j_uri,
+        auth=(settings.neo4j_username, settings.neo4j_password),
+        max_connection_pool_size=settings.neo4j_max_connection_pool_size,
+    )
+
+
+def _close_cached_driver() -> None:
+    if get_neo4j_driver.cache_info().currsize:
+        get_neo4j_driver().close()
+
+
+atexit.register(_close_cached_driver)
 
 
 @contextmanager
 def neo4j_session(database: str | None = None) -> Iterator:
     settings = get_settings()
-    driver = get_neo4j_driver()
-    try:
-        with driver.session(database=database or settings.neo4j_database) as session:
-            yield session
-    finally:
-        driver.close()
+    with get_neo4j_driver().session(database=database or settings.neo4j_database) as session:
+        yield session
@@ -1,57 +1,108 @@
 from __future__ import annotations
 
 import json
-from dataclasses import asdict, dataclass
-from typing import Any, Dict, Optional, Set
+import socket
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Sequence, Set
 
 from redis import Redis
 
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from .config import get_settings
 from .redis_client import get_redis_client
 
 
+def _json_dumps(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    # Compact separators keep the fallback byte-identical to orjson output so
+    # LREM-based acks match payloads regardless of which encoder wrote them.
+    return json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+
+
+def _json_loads(raw: bytes | str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 @dataclass
 class IndexJob:
     job_id: str
     collection: str
     raw_path: str
+    # The exact bytes this job was dequeued as; LREM acks must match them
+    # byte-for-byte, and payloads written by older encoders (different JSON
+    # separators) do not re-serialize identically.
+    _payload: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
 
-    def to_json(self) -> str:
-        return json.dumps(asdict(self))
+    def to_json(self) -> bytes:
+        return _json_dumps({"job_id": self.job_id, "collection": self.collection, "raw_path": self.raw_path})
 
     @classmethod
-    def from_json(cls, payload: str) -> "IndexJob":
-        data: Dict[str, Any] = json.loads(payload)
-        return cls(**data)
+    def from_json(cls, payload: bytes | str) -> "IndexJob":
+        data: Dict[str, Any] = _json_loads(payload)
+        job = cls(**data)
+        job._payload = payload if isinstance(payload, bytes) else payload.encode()
+        return job
 
 
 class JobQueue:
-    def __init__(self, redis_client: Optional[Redis] = None) -> None:
+    """Reliable Redis list queue: dequeue moves the payload atomically into a
+    per-host processing list, ack removes it, and recover_own requeues
+    whatever a crashed worker on this host left behind."""
+
+    def __init__(self, redis_client: Optional[Redis] = None, processing_suffix: Optional[str] = None) -> None:
         settings = get_settings()
         self.redis = redis_client or get_redis_client()
         self.queue_name = settings.index_queue_name
+        suffix = processing_suffix or socket.gethostname()
+        self.processing_key = f"{self.queue_name}:processing:{suffix}"
+        # Encode once; every queue op reuses the same bytes keys.
+        self._queue_name_bytes = self.queue_name.encode()
+        self._processing_key_bytes = self.processing_key.encode()
 
     def enqueue(self, job: IndexJob) -> None:
-        self.redis.rpush(self.queue_name, job.to_json())
+        self.redis.rpush(self._queue_name_bytes, job.to_json())
+
+    def enqueue_many(self, jobs: Sequence[IndexJob]) -> None:
+        """Push a batch of jobs with one variadic RPUSH instead of one
+        round-trip per job."""
+        if not jobs:
+            return
+        self.redis.rpush(self._queue_name_bytes, *(job.to_json() for job in jobs))
 
     def dequeue(self, timeout: int = 5) -> Optional[IndexJob]:
-        item = self.redis.blpop(self.queue_name, timeout=timeout)
-        if not item:
+        payload = self.redis.blmove(self._queue_name_bytes, self._processing_key_bytes, timeout, "LEFT", "RIGHT")
+        if not payload:
             return None
-        _, payload = item
         return IndexJob.from_json(payload)
 
+    def ack(self, job: IndexJob) -> None:
+        # Remove the original payload, not a re-encoding of it; otherwise jobs
+        # pushed by an older encoder would never match and would be re-run
+        # after every worker restart.
+        self.redis.lrem(self._processing_key_bytes, 1, job._payload if job._payload is not None else job.to_json())
+
+    def recover_own(self) -> int:
+        """Move jobs abandoned in this host's processing list back to the head
+        of the main queue. Returns the number of requeued jobs."""
+        moved = 0
+        while self.redis.rpoplpush(self._processing_key_bytes, self._queue_name_bytes) is not None:
+            moved += 1
+        return moved
+
     def list_job_ids(self) -> Set[str]:
-        entries = self.redis.lrange(self.queue_name, 0, -1)
+        entries = self.redis.lrange(self._queue_name_bytes, 0, -1)
         job_ids: Set[str] = set()
         for payload in entries:
-            if isinstance(payload, bytes):
-                payload_str = payload.decode("utf-8")
-            else:
-                payload_str = str(payload)
             try:
-                job = IndexJob.from_json(payload_str)
-            except json.JSONDecodeError:
+                job = IndexJob.from_json(payload)
+            except ValueError:
                 continue
             job_ids.add(job.job_id)
         return job_ids
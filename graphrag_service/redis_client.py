@@ -1,10 +1,35 @@
 from __future__ import annotations
 
+import atexit
+from functools import lru_cache
+
 import redis
 
 from .config import get_settings
 
 
+@lru_cache(maxsize=1)
 def get_redis_client() -> redis.Redis:
+    """Return the process-wide Redis client.
+
+    Each client owns a connection pool, so a single shared instance avoids
+    re-paying the handshake per JobStore/JobQueue. Keepalive and periodic
+    health checks let blocking pops survive idle-connection timeouts.
+    """
     settings = get_settings()
-    return redis.Redis.from_url(settings.redis_url, encoding="utf-8", decode_responses=True)
+    return redis.Redis.from_url(
+        settings.redis_url,
+        encoding="utf-8",
+        decode_responses=True,
+        max_connections=64,
+        socket_keepalive=True,
+        health_check_interval=30,
+    )
+
+
+def _close_cached_client() -> None:
+    if get_redis_client.cache_info().currsize:
+        get_redis_client().close()
+
+
+atexit.register(_close_cached_client)
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
 import json
+import math
+import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import TYPE_CHECKING, Iterable, List, Sequence
 
-import faiss
 import numpy as np
 
+if TYPE_CHECKING:
+    import faiss
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
 from .config import get_settings
 
 
+def _dumps(payload: object) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, ensure_ascii=False).encode("utf-8")
+
+
+def _loads(raw: bytes) -> object:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 @dataclass
 class VectorHit:
     chunk_id: str
@@ -21,6 +42,9 @@ class VectorHit:
 class FaissVectorStore:
     """Manage FAISS indices with metadata sidecars."""
 
+    TRAIN_SAMPLE_SIZE = 50_000
+    _QUANTIZER_TOKENS = {"none": "Flat", "fp16": "SQfp16", "int8": "SQ8"}
+
     def __init__(self, collection: str, base_dir: Path | None = None) -> None:
         settings = get_settings()
         self.collection = collection
@@ -32,18 +56,60 @@ class FaissVectorStore:
         self.metadata: dict[str, dict] = {}
         self._ids: list[str] = []
 
+    @classmethod
+    def _auto_index_factory(cls, count: int, dim: int) -> str:
+        """Pick an index type by collection size: exact for small sets, IVF for
+        large ones, IVF+PQ once memory becomes the constraint. Vector storage
+        precision follows the faiss_quantizer setting."""
+        storage = cls._QUANTIZER_TOKENS.get(get_settings().faiss_quantizer, "Flat")
+        if count <= 100_000:
+            return storage
+        nlist = int(math.sqrt(count))
+        if count <= 1_000_000:
+            return f"IVF{nlist},{storage}"
+        subquantizers = max(1, dim // 4)
+        while subquantizers > 1 and dim % subquantizers:
+            subquantizers -= 1
+        return f"IVF{nlist},PQ{subquantizers}x8"
+
+    @staticmethod
+    def _apply_search_params(index: faiss.Index) -> None:
+        settings = get_settings()
+        if hasattr(index, "nprobe"):
+            index.nprobe = settings.faiss_nprobe
+        if hasattr(index, "hnsw"):
+            index.hnsw.efSearch = settings.faiss_hnsw_ef_search
+
     def build(self, embeddings: np.ndarray, ids: Sequence[str]) -> None:
+        import faiss
+
         if embeddings.size == 0:
             raise ValueError("No embeddings provided to build FAISS index.")
 
-        dim = embeddings.shape[1]
-        index = faiss.IndexFlatIP(dim)
-
-        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
-        norms[norms == 0] = 1.0
-        normalized = embeddings / norms
-
-        index.add(normalized.astype(np.float32))
+        settings = get_settings()
+        count, dim = embeddings.shape
+        factory = settings.faiss_index_factory or self._auto_index_factory(count, dim)
+        if factory == "Flat":
+            index = faiss.IndexFlatIP(dim)
+        else:
+            index = faiss.index_factory(dim, factory, faiss.METRIC_INNER_PRODUCT)
+        if hasattr(index, "hnsw"):
+            index.hnsw.efConstruction = settings.faiss_hnsw_ef_construction
+
+        # Single-pass in-place SIMD normalization; zero vectors stay zero,
+        # matching the old norms==0 guard.
+        normalized = np.ascontiguousarray(embeddings, dtype=np.float32)
+        faiss.normalize_L2(normalized)
+
+        if not index.is_trained:
+            sample = normalized
+            if count > self.TRAIN_SAMPLE_SIZE:
+                rng = np.random.default_rng(0)
+                sample = np.ascontiguousarray(normalized[rng.choice(count, self.TRAIN_SAMPLE_SIZE, replace=False)])
+            index.train(sample)
+
+        index.add(normalized)
+        self._apply_search_params(index)
         self.index = index
         self._ids = list(ids)
 
@@ -60,48 +126,119 @@ class FaissVectorStore:
         self.metadata = metadata
 
     def save(self) -> None:
+        import faiss
+
         if not self.index:
             raise RuntimeError("Index has not been built yet.")
         faiss.write_index(self.index, str(self.index_path))
-        with self.metadata_path.open("w", encoding="utf-8") as fh:
-            for chunk_id in self._ids:
-                payload = self.metadata.get(chunk_id, {})
-                payload.setdefault("chunk_id", chunk_id)
-                fh.write(json.dumps(payload, ensure_ascii=False) + "\n")
+        # Columnar layout: field names are written once instead of per row and
+        # the whole sidecar serializes in a single dumps call.
+        rows = []
+        field_order: list[str] = []
+        seen_fields: set[str] = set()
+        for chunk_id in self._ids:
+            payload = self.metadata.get(chunk_id, {})
+            payload.setdefault("chunk_id", chunk_id)
+            rows.append(payload)
+            for field in payload:
+                if field not in seen_fields:
+                    seen_fields.add(field)
+                    field_order.append(field)
+        columns = {field: [row.get(field) for row in rows] for field in field_order}
+        self.metadata_path.write_bytes(_dumps({"columns": columns}))
 
     def load(self) -> None:
+        import faiss
+
         if not self.index_path.exists():
             raise FileNotFoundError(f"FAISS index not found at {self.index_path}")
         self.index = faiss.read_index(str(self.index_path))
+        self._apply_search_params(self.index)
         self.metadata = {}
-        with self.metadata_path.open("r", encoding="utf-8") as fh:
-            for line in fh:
-                if not line.strip():
-                    continue
-                row = json.loads(line)
-                chunk_id = row["chunk_id"]
-                self.metadata[chunk_id] = row
+        raw = self.metadata_path.read_bytes()
+        data: object = None
+        try:
+            data = _loads(raw)
+        except ValueError:
+            data = None
+        if isinstance(data, dict) and "columns" in data:
+            columns = data["columns"]
+            fields = list(columns)
+            chunk_ids = columns.get("chunk_id", [])
+            for idx, chunk_id in enumerate(chunk_ids):
+                self.metadata[chunk_id] = {field: columns[field][idx] for field in fields}
+            self._ids = list(chunk_ids)
+            return
+        # Legacy one-JSON-object-per-line sidecars.
+        for line in raw.splitlines():
+            if not line.strip():
+                continue
+            row = _loads(line)
+            chunk_id = row["chunk_id"]
+            self.metadata[chunk_id] = row
         self._ids = list(self.metadata.keys())
 
     def query(self, embedding: np.ndarray, top_k: int = 10) -> List[VectorHit]:
+        return self.query_batch(embedding.reshape(1, -1), top_k)[0]
+
+    def query_batch(self, embeddings: np.ndarray, top_k: int = 10) -> List[List[VectorHit]]:
+        """Search several query vectors in one call.
+
+        A single batched search lets FAISS run one multi-threaded matrix
+        multiply instead of a vector-matrix product per query, so query
+        variants (expansion, HyDE) should be passed together as a matrix.
+        """
+        import faiss
+
         if not self.index or not hasattr(self, "_ids"):
             raise RuntimeError("Index is not loaded.")
 
-        embedding = embedding.astype(np.float32)
-        norm = np.linalg.norm(embedding)
-        if norm != 0:
-            embedding = embedding / norm
-        scores, indices = self.index.search(np.expand_dims(embedding, axis=0), top_k)
-        result: List[VectorHit] = []
+        vecs = np.ascontiguousarray(embeddings, dtype=np.float32)
+        faiss.normalize_L2(vecs)
+        scores, indices = self.index.search(vecs, top_k)
 
-        for score, idx in zip(scores[0], indices[0]):
-            if idx == -1 or idx >= len(self._ids):
-                continue
-            chunk_id = self._ids[idx]
-            metadata = self.metadata.get(chunk_id, {})
-            result.append(VectorHit(chunk_id=chunk_id, score=float(score), metadata=metadata))
+        results: List[List[VectorHit]] = []
+        for row_scores, row_indices in zip(scores, indices):
+            hits: List[VectorHit] = []
+            for score, idx in zip(row_scores, row_indices):
+                if idx == -1 or idx >= len(self._ids):
+                    continue
+                chunk_id = self._ids[idx]
+                metadata = self.metadata.get(chunk_id, {})
+                hits.append(VectorHit(chunk_id=chunk_id, score=float(score), metadata=metadata))
+            results.append(hits)
+
+        return results
+
+
+_stores_lock = threading.Lock()
+_stores: dict[str, tuple[FaissVectorStore, float]] = {}
+
+
+def get_vector_store(collection: str) -> FaissVectorStore:
+    """Return a loaded store for the collection, shared across queries.
+
+    Loading re-reads the index and metadata sidecar from disk, which costs
+    hundreds of milliseconds on large collections; the cached instance is
+    reused until the index file's mtime changes (i.e. a reindex finished).
+    FAISS searches are read-thread-safe, so one instance can serve
+    concurrent queries.
+    """
+    settings = get_settings()
+    index_path = settings.indexes_dir / collection / "faiss" / settings.faiss_index_filename
+    mtime = index_path.stat().st_mtime if index_path.exists() else None
+    if mtime is not None:
+        with _stores_lock:
+            cached = _stores.get(collection)
+            if cached is not None and cached[1] == mtime:
+                return cached[0]
 
-        return result
+    store = FaissVectorStore(collection)
+    store.load()
+    if mtime is not None:
+        with _stores_lock:
+            _stores[collection] = (store, mtime)
+    return store
 
 
-__all__ = ["FaissVectorStore", "VectorHit"]
+__all__ = ["FaissVectorStore", "VectorHit", "get_vector_store"]
@@ -6,6 +6,16 @@ import sys
 from pathlib import Path
 from typing import Dict
 
+import yaml
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# libyaml's C emitter when available; the pure-Python dumper otherwise.
+_DUMPER = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 
 def load_dotenv(path: Path) -> Dict[str, str]:
     if not path.exists():
@@ -31,9 +41,13 @@ def load_dotenv(path: Path) -> Dict[str, str]:
 
 DOTENV_CACHE = load_dotenv(Path(".env"))
 
+# One snapshot instead of ~20 os.environ proxy hits; every getenv call decodes
+# the value into a fresh str, a plain dict lookup does not.
+ENV_CACHE: Dict[str, str] = dict(os.environ)
+
 
 def lookup_env(name: str) -> str | None:
-    value = os.getenv(name)
+    value = ENV_CACHE.get(name)
     if value is not None and value.strip():
         return value.strip()
     value = DOTENV_CACHE.get(name)
@@ -57,82 +71,101 @@ def optional_env(name: str, default: str | None = None) -> str | None:
     return value if value else default
 
 
-def optional_int(name: str, default: int) -> int:
-    raw = optional_env(name)
-    if raw is None:
-        return default
-    try:
-        return int(raw)
-    except ValueError as exc:
-        raise RuntimeError(f"Invalid integer value for {name}: {raw}") from exc
-
-
-def optional_float(name: str, default: float) -> float:
-    raw = optional_env(name)
-    if raw is None:
-        return default
-    try:
-        return float(raw)
-    except ValueError as exc:
-        raise RuntimeError(f"Invalid float value for {name}: {raw}") from exc
-
-
-def optional_bool(name: str, default: bool) -> bool:
-    raw = optional_env(name)
-    if raw is None:
-        return default
+def parse_bool(raw: str) -> bool:
     lowered = raw.lower()
     if lowered in {"true", "1", "yes"}:
         return True
     if lowered in {"false", "0", "no"}:
         return False
-    raise RuntimeError(f"Invalid boolean value for {name}: {raw}")
+    raise ValueError(f"expected true/false, got {raw!r}")
+
+
+DEFAULT_OUTPUT_PATH = "config.generated.yaml"
+
+# Required values: (dotted config path, env key).
+REQUIRED_SCHEMA = (
+    ("openai.api_key", "OPENAI_API_KEY"),
+    ("tavily.api_key", "TAVILY_API_KEY"),
+)
+
+# Optional values: (dotted config path, env key, default, caster). Walked in
+# order, which also fixes the section order of the generated file.
+OPTIONAL_SCHEMA = (
+    ("openai.base_url", "OPENAI_BASE_URL", "https://api.openai.com/v1", str),
+    ("openai.model", "QA_MODEL", "gpt-4o-mini", str),
+    ("openai.max_tokens", "OPENAI_MAX_TOKENS", 8000, int),
+    ("openai.temperature", "QA_TEMPERATURE", 0.4, float),
+    ("openai.proxy", "OPENAI_PROXY", "", str),
+    ("tavily.api_base_url", "TAVILY_API_BASE_URL", "https://api.tavily.com", str),
+    ("search.max_results", "SEARCH_MAX_RESULTS", 10, int),
+    ("scraping.enabled", "SCRAPING_ENABLED", False, parse_bool),
+    ("scraping.max_pages", "SCRAPING_MAX_PAGES", 5, int),
+    ("scraping.content_limit", "SCRAPING_CONTENT_LIMIT", 1500, int),
+    ("prompts.prompts_dir", "PROMPTS_DIR", "prompts", str),
+    ("prompts.system_prompt_file", "SYSTEM_PROMPT_FILE", "system_prompt.txt", str),
+    ("execution.max_steps", "EXECUTION_MAX_STEPS", 6, int),
+    ("execution.reports_dir", "EXECUTION_REPORTS_DIR", "reports", str),
+    ("execution.logs_dir", "EXECUTION_LOGS_DIR", "logs", str),
+    ("logging.config_file", "LOGGING_CONFIG_FILE", "logging_config.yaml", str),
+    ("mcp.context_limit", "MCP_CONTEXT_LIMIT", 15000, int),
+)
+
+
+def set_path(config: dict, dotted: str, value: object) -> None:
+    parts = dotted.split(".")
+    node = config
+    for part in parts[:-1]:
+        node = node.setdefault(part, {})
+    node[parts[-1]] = value
+
+
+def parse_optional_values() -> Dict[str, object]:
+    """Validate and coerce every optional env value in one pass.
+
+    Returns a flat dotted-path -> typed-value dict; a malformed value fails
+    fast with the offending key and the caster's message before anything is
+    written.
+    """
+    values: Dict[str, object] = {}
+    for dotted, env_name, default, caster in OPTIONAL_SCHEMA:
+        raw = lookup_env(env_name)
+        if raw is None:
+            values[dotted] = default
+            continue
+        try:
+            values[dotted] = caster(raw)
+        except ValueError as exc:
+            raise RuntimeError(f"Invalid value {env_name}={raw!r}: {exc}") from exc
+    return values
 
 
 def build_config() -> dict:
-    openai_api_key = require_env("OPENAI_API_KEY")
-    tavily_api_key = require_env("TAVILY_API_KEY")
-
-    return {
-        "openai": {
-            "api_key": openai_api_key,
-            "base_url": optional_env("OPENAI_BASE_URL", "https://api.openai.com/v1"),
-            "model": optional_env("QA_MODEL", "gpt-4o-mini"),
-            "max_tokens": optional_int("OPENAI_MAX_TOKENS", 8000),
-            "temperature": optional_float("QA_TEMPERATURE", 0.4),
-            "proxy": optional_env("OPENAI_PROXY", ""),
-        },
-        "tavily": {
-            "api_key": tavily_api_key,
-            "api_base_url": optional_env("TAVILY_API_BASE_URL", "https://api.tavily.com"),
-        },
-        "search": {"max_results": optional_int("SEARCH_MAX_RESULTS", 10)},
-        "scraping": {
-            "enabled": optional_bool("SCRAPING_ENABLED", False),
-            "max_pages": optional_int("SCRAPING_MAX_PAGES", 5),
-            "content_limit": optional_int("SCRAPING_CONTENT_LIMIT", 1500),
-        },
-        "prompts": {
-            "prompts_dir": optional_env("PROMPTS_DIR", "prompts"),
-            "system_prompt_file": optional_env("SYSTEM_PROMPT_FILE", "system_prompt.txt"),
-        },
-        "execution": {
-            "max_steps": optional_int("EXECUTION_MAX_STEPS", 6),
-            "reports_dir": optional_env("EXECUTION_REPORTS_DIR", "reports"),
-            "logs_dir": optional_env("EXECUTION_LOGS_DIR", "logs"),
-        },
-        "logging": {"config_file": optional_env("LOGGING_CONFIG_FILE", "logging_config.yaml")},
-        "mcp": {
-            "context_limit": optional_int("MCP_CONTEXT_LIMIT", 15000),
-            "transport_config": {},
-        },
-    }
+    config: dict = {}
+    for dotted, env_name in REQUIRED_SCHEMA:
+        set_path(config, dotted, require_env(env_name))
+
+    for dotted, value in parse_optional_values().items():
+        set_path(config, dotted, value)
+
+    config["mcp"]["transport_config"] = {}
+    return config
 
 
 def main() -> None:
-    output_path = Path(optional_env("DEV_APP_CONFIG_PATH", "config.generated.yaml") or "config.generated.yaml")
+    output_path = Path(optional_env("DEV_APP_CONFIG_PATH", DEFAULT_OUTPUT_PATH) or DEFAULT_OUTPUT_PATH)
     config = build_config()
-    output_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    if lookup_env("DEV_CONFIG_JSON") == "1":
+        # JSON fast path for CI: YAML is a JSON superset, so yaml.safe_load
+        # consumers parse it unchanged, and emission skips the YAML emitter.
+        if orjson is not None:
+            output_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            output_path.write_text(json.dumps(config, indent=2), encoding="utf-8")
+    else:
+        # Stream straight to the file handle so the emitter never materializes
+        # the whole document as an intermediate str.
+        with output_path.open("w", encoding="utf-8") as fh:
+            yaml.dump(config, stream=fh, Dumper=_DUMPER, sort_keys=False, allow_unicode=True)
     print(json.dumps({"event": "dev_config_generated", "path": str(output_path.resolve())}))
 
 